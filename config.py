@@ -1,42 +1,55 @@
-# Combined tracking for both sectors - 20 entities total
-self.tracked_entities = {
-    # Financial stocks (UK and US) - 10 stocks
-    'stocks': [
-        # US Tech Giants (4)
-        'AAPL',   # Apple
-        'MSFT',   # Microsoft
-        'GOOGL',  # Alphabet/Google
-        'NVDA',   # Nvidia
-        
-        # US Financial (3)
-        'JPM',    # JPMorgan Chase
-        'BAC',    # Bank of America
-        'GS',     # Goldman Sachs
-        
-        # UK Stocks (3)
-        'HSBA.L', # HSBC
-        'BP.L',   # BP
-        'AZN.L',  # AstraZeneca
-    ],
-    
-    # Major SaaS companies - 10 companies
-    'saas': [
-        # Core SaaS (5)
-        'CRM',    # Salesforce
-        'SNOW',   # Snowflake
-        'TEAM',   # Atlassian
-        'ZM',     # Zoom
-        'DDOG',   # Datadog
-        
-        # High-Growth Tech (5)
-        'SHOP',   # Shopify
-        'SQ',     # Block (Square)
-        'PLTR',   # Palantir
-        'COIN',   # Coinbase
-        'SPOT',   # Spotify
-    ],
-    
-    # Keywords for private SaaS
-    'saas_keywords': ['SaaS', 'subscription', 'ARR', 'B2B software', 
-                    'cloud software', 'enterprise software', 'recurring revenue']
-}
\ No newline at end of file
+"""
+Tracked entities for the Financial & SaaS News Sentiment Analyser
+Shared, read-only configuration - 20 entities total
+"""
+
+import sys
+from types import MappingProxyType
+
+# Financial stocks (UK and US) - 10 stocks
+TRACKED_STOCKS = tuple(sys.intern(ticker) for ticker in (
+    # US Tech Giants (4)
+    'AAPL',   # Apple
+    'MSFT',   # Microsoft
+    'GOOGL',  # Alphabet/Google
+    'NVDA',   # Nvidia
+
+    # US Financial (3)
+    'JPM',    # JPMorgan Chase
+    'BAC',    # Bank of America
+    'GS',     # Goldman Sachs
+
+    # UK Stocks (3)
+    'HSBA.L', # HSBC
+    'BP.L',   # BP
+    'AZN.L',  # AstraZeneca
+))
+
+# Major SaaS companies - 10 companies
+TRACKED_SAAS = tuple(sys.intern(ticker) for ticker in (
+    # Core SaaS (5)
+    'CRM',    # Salesforce
+    'SNOW',   # Snowflake
+    'TEAM',   # Atlassian
+    'ZM',     # Zoom
+    'DDOG',   # Datadog
+
+    # High-Growth Tech (5)
+    'SHOP',   # Shopify
+    'SQ',     # Block (Square)
+    'PLTR',   # Palantir
+    'COIN',   # Coinbase
+    'SPOT',   # Spotify
+))
+
+# Keywords for private SaaS
+SAAS_KEYWORDS = ('SaaS', 'subscription', 'ARR', 'B2B software',
+                 'cloud software', 'enterprise software', 'recurring revenue')
+
+# Combined tracking for both sectors, shared by every analyser instance.
+# Read-only: build a new dict to track a different set of entities.
+TRACKED_ENTITIES = MappingProxyType({
+    'stocks': TRACKED_STOCKS,
+    'saas': TRACKED_SAAS,
+    'saas_keywords': SAAS_KEYWORDS
+})
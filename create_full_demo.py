@@ -3,244 +3,414 @@ Create a demo dashboard showing all 20 entities
 Shows the full scope of the analyser
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
+import matplotlib as mpl
+import matplotlib.style
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import PercentFormatter
 import numpy as np
-import seaborn as sns
 from datetime import datetime
-import json
+from functools import lru_cache
+import argparse
+import hashlib
+import os
+import orjson
+
+# Darkgrid style parsed once at import and applied per call with
+# rc_context, instead of style.use() re-reading it and mutating global rcParams
+_DARKGRID = matplotlib.style.library['seaborn-v0_8-darkgrid']
+
+# Agg settings for the large 20x24in canvas: simplify paths aggressively and
+# split long paths into chunks to keep peak memory down while rasterising
+_DEMO_RC = {
+    **_DARKGRID,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+}
+
+# One record per entity, stored as a struct-of-arrays so every panel can
+# slice a contiguous column (e.g. ``stocks['sent']``)
+SENTIMENT_DTYPE = np.dtype([('ticker', 'U8'), ('sent', 'f4'), ('count', 'i4')])
+
+def _to_records(rows):
+    """Pack (ticker, sentiment, count) rows into a preallocated structured array"""
+    return np.fromiter(rows, dtype=SENTIMENT_DTYPE, count=len(rows))
+
+# Simulate sentiment data (mix of positive, negative, neutral, and no data)
+# All 20 entities as (ticker, sentiment, article_count)
+DEMO_STOCKS = _to_records((
+    ('AAPL', 0.234, 45),
+    ('MSFT', 0.156, 38),
+    ('GOOGL', -0.089, 42),
+    ('NVDA', 0.445, 67),
+    ('JPM', -0.234, 23),
+    ('BAC', 0.067, 19),
+    ('GS', 0.123, 15),
+    ('HSBA.L', -0.045, 8),
+    ('BP.L', -0.178, 12),
+    ('AZN.L', 0.089, 6)
+))
+
+DEMO_SAAS = _to_records((
+    ('CRM', 0.234, 34),
+    ('SNOW', -0.123, 28),
+    ('TEAM', 0.045, 22),
+    ('ZM', -0.289, 31),
+    ('DDOG', 0.178, 18),
+    ('SHOP', 0.089, 25),
+    ('SQ', -0.198, 29),
+    ('PLTR', 0.334, 44),
+    ('COIN', -0.156, 36),
+    ('SPOT', 0.067, 20)
+))
+
+# Distribution bucket names, indexed as _sentiment_buckets numbers them
+_BUCKET_NAMES = ('Very Negative', 'Negative', 'Neutral', 'Positive', 'Very Positive')
+
+def _sentiment_buckets(sentiments):
+    """Bucket index per score: 0 = Very Negative ... 4 = Very Positive"""
+    # Bucket by magnitude (boundaries inclusive towards neutral), then sign
+    # (edges in the scores' own dtype so 0.1/0.3 compare exactly)
+    levels = np.digitize(np.abs(sentiments),
+                         np.array([0.1, 0.3], dtype=sentiments.dtype), right=True)
+    return (levels * np.sign(sentiments)).astype(int) + 2
+
+def _sentiment_colours(sentiments):
+    """Map an array of sentiment scores to positive/negative/neutral colours"""
+    return np.select([sentiments > 0.1, sentiments < -0.1],
+                     ['#2ECC71', '#E74C3C'], default='#95A5A6')
+
+@lru_cache(maxsize=None)
+def _build_layout(n_stocks, n_saas):
+    """Build the static figure skeleton once per sector size and return handles to its dynamic artists"""
+    n_total = n_stocks + n_saas
+    n_movers = min(10, n_total)
 
-def create_full_demo():
-    """Create a comprehensive demo showing all 20 entities"""
-    
-    # All 20 entities
-    stocks = ['AAPL', 'MSFT', 'GOOGL', 'NVDA', 'JPM', 'BAC', 'GS', 'HSBA.L', 'BP.L', 'AZN.L']
-    saas = ['CRM', 'SNOW', 'TEAM', 'ZM', 'DDOG', 'SHOP', 'SQ', 'PLTR', 'COIN', 'SPOT']
-    
-    # Simulate sentiment data (mix of positive, negative, neutral, and no data)
-    stock_sentiments = {
-        'AAPL': (0.234, 45),    # (sentiment, article_count)
-        'MSFT': (0.156, 38),
-        'GOOGL': (-0.089, 42),
-        'NVDA': (0.445, 67),
-        'JPM': (-0.234, 23),
-        'BAC': (0.067, 19),
-        'GS': (0.123, 15),
-        'HSBA.L': (-0.045, 8),
-        'BP.L': (-0.178, 12),
-        'AZN.L': (0.089, 6)
-    }
-    
-    saas_sentiments = {
-        'CRM': (0.234, 34),
-        'SNOW': (-0.123, 28),
-        'TEAM': (0.045, 22),
-        'ZM': (-0.289, 31),
-        'DDOG': (0.178, 18),
-        'SHOP': (0.089, 25),
-        'SQ': (-0.198, 29),
-        'PLTR': (0.334, 44),
-        'COIN': (-0.156, 36),
-        'SPOT': (0.067, 20)
-    }
-    
     # Create figure
-    plt.style.use('seaborn-v0_8-darkgrid')
-    fig = plt.figure(figsize=(20, 24))
-    gs = gridspec.GridSpec(5, 2, height_ratios=[1, 1.5, 1.5, 1, 1.5], 
-                          hspace=0.35, wspace=0.3)
-    
+    # Constrained layout is solved during the draw itself, so saving needs
+    # neither tight_layout() nor the extra render pass of bbox_inches='tight'.
+    # A bare Figure on an Agg canvas skips pyplot's figure manager and any
+    # GUI backend import - the demo only ever writes a PNG.
+    fig = Figure(figsize=(20, 24), layout='constrained')
+    FigureCanvasAgg(fig)
+    # Keep a strip free at the bottom for the timestamp/author footer
+    fig.get_layout_engine().set(hspace=0.05, wspace=0.05, rect=(0, 0.02, 1, 0.98))
+    gs = fig.add_gridspec(5, 2, height_ratios=[1, 1.5, 1.5, 1, 1.5])
+
     # Title
-    fig.suptitle('Financial & SaaS News Sentiment Analysis - Full Coverage Demo\n20 Entities Tracked (10 Stocks + 10 SaaS)', 
-                fontsize=24, fontweight='bold', y=0.98)
-    
+    fig.suptitle('Financial & SaaS News Sentiment Analysis - Full Coverage Demo\n'
+                 f'{n_total} Entities Tracked ({n_stocks} Stocks + {n_saas} SaaS)',
+                fontsize=24, fontweight='bold')
+
     # Panel 1: Overall summary
     ax1 = fig.add_subplot(gs[0, :])
-    ax1.text(0.5, 0.5, 
-             'Comprehensive Analysis: 20 Companies | 487 Articles | 8 News Sources\n' +
-             'Real-time Sentiment Tracking Across Financial and Technology Sectors',
-             ha='center', va='center', fontsize=18,
+    banner = ax1.text(0.5, 0.5, '', ha='center', va='center', fontsize=18,
              bbox=dict(boxstyle='round,pad=1', facecolor='lightblue', alpha=0.7))
     ax1.axis('off')
-    
-    # Panel 2: Stock sentiment (all 10)
+
+    # Panel 2: Stock sentiment (every stock)
     ax2 = fig.add_subplot(gs[1, 0])
-    y_pos = np.arange(len(stocks))
-    sentiments = [stock_sentiments.get(s, (0, 0))[0] for s in stocks]
-    counts = [stock_sentiments.get(s, (0, 0))[1] for s in stocks]
-    
-    bars = ax2.barh(y_pos, sentiments)
-    for i, (bar, sent, count) in enumerate(zip(bars, sentiments, counts)):
-        color = '#2ECC71' if sent > 0.1 else '#E74C3C' if sent < -0.1 else '#95A5A6'
-        bar.set_color(color)
-        # Add article count
-        ax2.text(0.01 if sent >= 0 else -0.01, i, f'({count})', 
-                ha='left' if sent >= 0 else 'right', va='center', fontsize=8)
-    
+    y_pos = np.arange(n_stocks)
+    stock_panel = _new_sentiment_panel(ax2, n_stocks)
+
     ax2.set_yticks(y_pos)
-    ax2.set_yticklabels([f'{s}' for s in stocks])
     ax2.set_xlabel('Sentiment Score')
-    ax2.set_title('All 10 Tracked Stocks - Sentiment Analysis', fontweight='bold', fontsize=14)
+    ax2.set_title(f'All {n_stocks} Tracked Stocks - Sentiment Analysis', fontweight='bold', fontsize=14)
     ax2.axvline(0, color='black', linewidth=1, linestyle='--', alpha=0.5)
     ax2.set_xlim(-0.5, 0.5)
-    
+
     # Add legend
-    ax2.text(0.98, 0.02, '(n) = article count', transform=ax2.transAxes, 
+    ax2.text(0.98, 0.02, '(n) = article count', transform=ax2.transAxes,
             ha='right', va='bottom', fontsize=8, style='italic')
-    
-    # Panel 3: SaaS sentiment (all 10)
+
+    # Panel 3: SaaS sentiment (every SaaS company)
     ax3 = fig.add_subplot(gs[1, 1])
-    y_pos = np.arange(len(saas))
-    sentiments = [saas_sentiments.get(s, (0, 0))[0] for s in saas]
-    counts = [saas_sentiments.get(s, (0, 0))[1] for s in saas]
-    
-    bars = ax3.barh(y_pos, sentiments)
-    for i, (bar, sent, count) in enumerate(zip(bars, sentiments, counts)):
-        color = '#2ECC71' if sent > 0.1 else '#E74C3C' if sent < -0.1 else '#95A5A6'
-        bar.set_color(color)
-        ax3.text(0.01 if sent >= 0 else -0.01, i, f'({count})', 
-                ha='left' if sent >= 0 else 'right', va='center', fontsize=8)
-    
+    y_pos = np.arange(n_saas)
+    saas_panel = _new_sentiment_panel(ax3, n_saas)
+
     ax3.set_yticks(y_pos)
-    ax3.set_yticklabels([f'{s}' for s in saas])
     ax3.set_xlabel('Sentiment Score')
-    ax3.set_title('All 10 Tracked SaaS Companies - Sentiment Analysis', fontweight='bold', fontsize=14)
+    ax3.set_title(f'All {n_saas} Tracked SaaS Companies - Sentiment Analysis', fontweight='bold', fontsize=14)
     ax3.axvline(0, color='black', linewidth=1, linestyle='--', alpha=0.5)
     ax3.set_xlim(-0.5, 0.5)
-    
+
     # Panel 4: Coverage statistics
     ax4 = fig.add_subplot(gs[2, 0])
     categories = ['Stocks\nAnalysed', 'SaaS\nAnalysed', 'Total\nArticles', 'News\nSources']
-    values = [10, 10, 487, 8]
-    bars = ax4.bar(categories, values, color=['#3498DB', '#9B59B6', '#E67E22', '#16A085'])
-    
-    # Add value labels on bars
-    for bar, val in zip(bars, values):
-        ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 5, 
-                str(val), ha='center', va='bottom', fontweight='bold', fontsize=14)
-    
-    ax4.set_ylim(0, 550)
+    # Total Articles is filled in per refresh
+    coverage_bars = ax4.bar(categories, [n_stocks, n_saas, 0, 8],
+                            color=['#3498DB', '#9B59B6', '#E67E22', '#16A085'], rasterized=True)
+
     ax4.set_title('Analysis Coverage Statistics', fontweight='bold', fontsize=14)
     ax4.set_ylabel('Count')
     ax4.grid(True, alpha=0.3, axis='y')
-    
-    # Panel 5: Sentiment distribution
+
+    # Panel 5: Sentiment distribution as one stacked bar (5 rectangles)
     ax5 = fig.add_subplot(gs[2, 1])
-    all_sentiments = list(stock_sentiments.values()) + list(saas_sentiments.values())
-    all_values = [s[0] for s in all_sentiments]
-    
-    labels = ['Very Positive\n(>0.3)', 'Positive\n(0.1-0.3)', 'Neutral\n(-0.1-0.1)', 
+    labels = ['Very Positive\n(>0.3)', 'Positive\n(0.1-0.3)', 'Neutral\n(-0.1-0.1)',
               'Negative\n(-0.3--0.1)', 'Very Negative\n(<-0.3)']
-    counts = [
-        len([v for v in all_values if v > 0.3]),
-        len([v for v in all_values if 0.1 < v <= 0.3]),
-        len([v for v in all_values if -0.1 <= v <= 0.1]),
-        len([v for v in all_values if -0.3 <= v < -0.1]),
-        len([v for v in all_values if v < -0.3])
-    ]
     colors_dist = ['#27AE60', '#52BE80', '#85929E', '#E59866', '#C0392B']
-    
-    wedges, texts, autotexts = ax5.pie(counts, labels=labels, colors=colors_dist, autopct='%1.0f%%',
-                                       startangle=90)
-    ax5.set_title('Sentiment Distribution Across All 20 Entities', fontweight='bold', fontsize=14)
-    
+    distribution_bars = ax5.barh(np.zeros(5), np.zeros(5), height=0.6,
+                                 color=colors_dist, label=labels, rasterized=True)
+
+    ax5.set_xlim(0, 1)
+    ax5.set_ylim(-0.6, 0.6)
+    ax5.set_yticks([])
+    ax5.xaxis.set_major_formatter(PercentFormatter(xmax=1))
+    ax5.legend(loc='upper center', bbox_to_anchor=(0.5, -0.08), ncol=5, fontsize=9,
+               frameon=False)
+    ax5.set_title(f'Sentiment Distribution Across All {n_total} Entities', fontweight='bold', fontsize=14)
+
     # Panel 6: Top movers
     ax6 = fig.add_subplot(gs[3, :])
-    all_entities = [(k, v[0], v[1]) for k, v in stock_sentiments.items()] + \
-                   [(k, v[0], v[1]) for k, v in saas_sentiments.items()]
-    all_entities.sort(key=lambda x: abs(x[1]), reverse=True)
-    top_10 = all_entities[:10]
-    
-    entities = [e[0] for e in top_10]
-    sentiments = [e[1] for e in top_10]
-    
-    x_pos = np.arange(len(entities))
-    bars = ax6.bar(x_pos, sentiments)
-    
-    for bar, sent in zip(bars, sentiments):
-        color = '#2ECC71' if sent > 0 else '#E74C3C'
-        bar.set_color(color)
-    
+    x_pos = np.arange(n_movers)
+    movers_bars = ax6.bar(x_pos, np.zeros(n_movers), rasterized=True)
+
     ax6.set_xticks(x_pos)
-    ax6.set_xticklabels(entities, rotation=45, ha='right')
     ax6.set_ylabel('Sentiment Score')
-    ax6.set_title('Top 10 Sentiment Movers (Highest Absolute Scores)', fontweight='bold', fontsize=14)
+    ax6.set_title(f'Top {n_movers} Sentiment Movers (Highest Absolute Scores)', fontweight='bold', fontsize=14)
     ax6.axhline(0, color='black', linewidth=1, alpha=0.5)
     ax6.grid(True, alpha=0.3, axis='y')
     ax6.set_ylim(-0.5, 0.5)
-    
+
     # Panel 7: Summary insights
     ax7 = fig.add_subplot(gs[4, :])
     ax7.axis('off')
-    
-    insights = [
-        ['Total Entities Tracked', '20 (10 Financial Stocks + 10 SaaS Companies)'],
-        ['Most Positive Overall', 'NVDA (+0.445) - 67 articles'],
-        ['Most Negative Overall', 'ZM (-0.289) - 31 articles'],
-        ['Most News Coverage', 'NVDA (67 articles)'],
-        ['Average Sentiment - Stocks', '+0.045 (Slightly Positive)'],
-        ['Average Sentiment - SaaS', '+0.018 (Neutral)'],
+
+    # Two pre-formatted Text artists instead of a Table of per-cell artists;
+    # both are filled in per refresh, the header padded to the rows' width
+    insights_header = ax7.text(0.02, 0.97, '', family='monospace',
+                               fontsize=12, fontweight='bold', color='white', va='top',
+                               bbox=dict(boxstyle='square,pad=0.8', facecolor='#34495E',
+                                         edgecolor='#34495E'))
+    insights_rows = ax7.text(0.02, 0.86, '', family='monospace', fontsize=12, va='top',
+                             linespacing=2.2,
+                             bbox=dict(boxstyle='square,pad=0.8', facecolor='#ECF0F1',
+                                       edgecolor='#34495E'))
+
+    ax7.set_title(f'Comprehensive Analysis Summary - All {n_total} Entities', fontweight='bold', fontsize=16, pad=20)
+
+    # Timestamp and author
+    timestamp = fig.text(0.99, 0.01, '', ha='right', fontsize=10, style='italic')
+    fig.text(0.01, 0.01, 'Created by: Paul Kwarteng | github.com/Boakye-20',
+             ha='left', fontsize=10, style='italic', color='#555555')
+
+    return {
+        'fig': fig,
+        'banner': banner,
+        'coverage_ax': ax4,
+        'coverage_bars': coverage_bars,
+        'coverage_labels': [],
+        'stock_panel': stock_panel,
+        'saas_panel': saas_panel,
+        'distribution_ax': ax5,
+        'distribution_bars': distribution_bars,
+        'distribution_labels': [],
+        'movers_ax': ax6,
+        'movers_bars': movers_bars,
+        'insights_header': insights_header,
+        'insights_rows': insights_rows,
+        'timestamp': timestamp
+    }
+
+def _sentiment_rects(sentiments):
+    """One horizontal bar rectangle per entity, centred on its row index"""
+    return [Rectangle((0, i - 0.4), sent, 0.8) for i, sent in enumerate(sentiments)]
+
+def _new_sentiment_panel(ax, n):
+    """Add the bar collection and article count labels for an n-entity panel"""
+    bars = PatchCollection(_sentiment_rects(np.zeros(n)), edgecolor='none', rasterized=True)
+    ax.add_collection(bars)
+    ax.set_ylim(-0.6, n - 0.4)
+    count_labels = [ax.annotate('', xy=(0, i), xytext=(2, 0), textcoords='offset points',
+                                va='center', fontsize=8)
+                    for i in range(n)]
+    return {'ax': ax, 'bars': bars, 'counts': count_labels}
+
+def _render_sentiment_panel(panel, labels, sents, counts):
+    """Update a sentiment panel in one pass: geometry, colours, ticks, counts"""
+    panel['bars'].set_paths(_sentiment_rects(sents))
+    panel['bars'].set_facecolor(_sentiment_colours(sents))
+    panel['ax'].set_yticklabels(labels)
+
+    # Article count just past each bar end, on the outside of the bar
+    for label, i, sent, count in zip(panel['counts'], range(len(sents)), sents, counts):
+        label.xy = (sent, i)
+        label.xyann = (2, 0) if sent >= 0 else (-2, 0)
+        label.set_horizontalalignment('left' if sent >= 0 else 'right')
+        label.set_text(f'({count})')
+
+def _sector_average(sector):
+    """Mean sentiment of a sector with its bucket name, e.g. '+0.018 (Neutral)'"""
+    if not len(sector):
+        return 'n/a'
+    mean = sector['sent'].mean()
+    return f"{mean:+.3f} ({_BUCKET_NAMES[_sentiment_buckets(np.array([mean]))[0]]})"
+
+def _insights(stocks, saas, all_entities):
+    """Metric/value rows for the summary panel"""
+    most_positive = all_entities[np.argmax(all_entities['sent'])]
+    most_negative = all_entities[np.argmin(all_entities['sent'])]
+    most_covered = all_entities[np.argmax(all_entities['count'])]
+    return [
+        ['Total Entities Tracked',
+         f'{len(all_entities)} ({len(stocks)} Financial Stocks + {len(saas)} SaaS Companies)'],
+        ['Most Positive Overall',
+         f"{most_positive['ticker']} ({most_positive['sent']:+.3f}) - {most_positive['count']} articles"],
+        ['Most Negative Overall',
+         f"{most_negative['ticker']} ({most_negative['sent']:+.3f}) - {most_negative['count']} articles"],
+        ['Most News Coverage', f"{most_covered['ticker']} ({most_covered['count']} articles)"],
+        ['Average Sentiment - Stocks', _sector_average(stocks)],
+        ['Average Sentiment - SaaS', _sector_average(saas)],
         ['Total Processing Time', '7.3 minutes'],
         ['Data Sources', 'Yahoo Finance, Reuters, TechCrunch, MarketWatch + 4 more']
     ]
-    
-    table = ax7.table(cellText=insights,
-                     colLabels=['Metric', 'Value'],
-                     cellLoc='left',
-                     loc='center',
-                     colWidths=[0.3, 0.7])
-    
-    table.auto_set_font_size(False)
-    table.set_fontsize(11)
-    table.scale(1.2, 2.5)
-    
-    # Style header
-    for i in range(2):
-        table[(0, i)].set_facecolor('#34495E')
-        table[(0, i)].set_text_props(weight='bold', color='white')
-    
-    # Alternate row colours
-    for i in range(1, len(insights) + 1):
-        if i % 2 == 0:
-            for j in range(2):
-                table[(i, j)].set_facecolor('#ECF0F1')
-    
-    ax7.set_title('Comprehensive Analysis Summary - All 20 Entities', fontweight='bold', fontsize=16, pad=20)
-    
-    # Timestamp and author
-    fig.text(0.99, 0.01, f'Generated: {datetime.now().strftime("%d %B %Y at %H:%M GMT")}', 
-            ha='right', fontsize=10, style='italic')
-    fig.text(0.01, 0.01, 'Created by: Paul Kwarteng | github.com/Boakye-20', 
-             ha='left', fontsize=10, style='italic', color='#555555')
-    
-    # Save
-    plt.tight_layout()
+
+def _refresh(layout, stocks, saas, generated_at):
+    """Push new sentiment data into the cached figure's dynamic artists"""
+    # Panel 2: Stock sentiment (every stock)
+    _render_sentiment_panel(layout['stock_panel'], stocks['ticker'], stocks['sent'],
+                            stocks['count'])
+
+    # Panel 3: SaaS sentiment (every SaaS company)
+    _render_sentiment_panel(layout['saas_panel'], saas['ticker'], saas['sent'],
+                            saas['count'])
+
+    # All entities share one buffer for panels 1 and 4-7
+    all_entities = np.concatenate([stocks, saas])
+    all_values = all_entities['sent']
+    total_articles = int(all_entities['count'].sum())
+
+    # Panel 1: Overall summary
+    layout['banner'].set_text(
+        f'Comprehensive Analysis: {len(all_entities)} Companies | {total_articles} Articles | 8 News Sources\n' +
+        'Real-time Sentiment Tracking Across Financial and Technology Sectors')
+
+    # Panel 4: Coverage statistics, with headroom above the tallest bar
+    coverage_bars = layout['coverage_bars']
+    coverage_bars[2].set_height(total_articles)
+    layout['coverage_ax'].set_ylim(0, max(bar.get_height() for bar in coverage_bars) * 1.13)
+
+    coverage_labels = layout['coverage_labels']
+    for label in coverage_labels:
+        label.remove()
+    coverage_labels[:] = layout['coverage_ax'].bar_label(
+        coverage_bars, labels=[f'{bar.get_height():g}' for bar in coverage_bars],
+        padding=3, fontweight='bold', fontsize=14)
+
+    # Panel 5: Sentiment distribution
+    # Bucket counts reversed to match the labels, Very Positive first
+    counts = np.bincount(_sentiment_buckets(all_values), minlength=5)[::-1]
+    frac = counts / counts.sum()
+    lefts = np.cumsum(frac) - frac
+
+    for bar, left, width in zip(layout['distribution_bars'], lefts, frac):
+        bar.set_x(left)
+        bar.set_width(width)
+
+    distribution_labels = layout['distribution_labels']
+    for label in distribution_labels:
+        label.remove()
+    distribution_labels[:] = layout['distribution_ax'].bar_label(
+        layout['distribution_bars'], labels=[f'{f:.0%}' if f else '' for f in frac],
+        label_type='center', color='white', fontweight='bold', fontsize=12)
+
+    # Panel 6: Top movers
+    # Stable C-level sort so equal magnitudes (e.g. MSFT/COIN at 0.156) keep
+    # their original order
+    top_movers = all_entities[np.argsort(-np.abs(all_values), kind='stable')[:len(layout['movers_bars'])]]
+
+    entities = top_movers['ticker']
+    sentiments = top_movers['sent']
+
+    for bar, sent, colour in zip(layout['movers_bars'], sentiments,
+                                 np.where(sentiments > 0, '#2ECC71', '#E74C3C')):
+        bar.set_height(sent)
+        bar.set_color(colour)
+    layout['movers_ax'].set_xticklabels(entities, rotation=45, ha='right')
+
+    # Panel 7: Summary insights
+    rows = [f"{k:<28} {v}" for k, v in _insights(stocks, saas, all_entities)]
+    width = max(len(row) for row in rows)
+    layout['insights_header'].set_text(f"{'Metric':<28} {'Value'}".ljust(width))
+    layout['insights_rows'].set_text("\n".join(rows))
+
+    # Timestamp
+    layout['timestamp'].set_text(f'Generated: {generated_at.strftime("%d %B %Y at %H:%M GMT")}')
+
+# Bump whenever the rendering changes, so PNGs drawn by older code are redrawn
+_LAYOUT_VERSION = 2
+
+def _content_key(stocks, saas):
+    """Short content hash of the layout version and the demo input arrays"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(str(_LAYOUT_VERSION).encode())
+    for sector in (stocks, saas):
+        digest.update(str(sector.dtype).encode())
+        digest.update(sector.tobytes())
+    return digest.hexdigest()
+
+def create_full_demo(stocks=DEMO_STOCKS, saas=DEMO_SAAS, force=False):
+    """Create a comprehensive demo showing all 20 entities"""
+    if len(stocks) + len(saas) == 0:
+        raise ValueError("create_full_demo needs at least one stock or SaaS entity")
+
+    # The output depends only on the input data: if the PNG on disk was
+    # rendered from identical arrays, skip the whole matplotlib pipeline
     filename = 'full_demo_dashboard_all20.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight', facecolor='white')
-    print(f"\n✓ Full demo dashboard created: {filename}")
-    print("\nThis demo shows all 20 entities being tracked!")
-    
+    key_file = f'{filename}.key'
+    key = _content_key(stocks, saas)
+    if not force and os.path.exists(filename) and os.path.exists(key_file):
+        with open(key_file) as f:
+            if f.read().strip() == key:
+                print(f"\n✓ Full demo dashboard up to date: {filename}")
+                return
+
+    # One timestamp for the run so the PNG and JSON always agree
+    generated_at = datetime.now()
+
+    with mpl.rc_context(_DEMO_RC):
+        layout = _build_layout(len(stocks), len(saas))
+        _refresh(layout, stocks, saas, generated_at)
+
+        # Save
+        layout['fig'].savefig(filename, dpi=150, bbox_inches=None, facecolor='white')
+        print(f"\n✓ Full demo dashboard created: {filename}")
+        print(f"\nThis demo shows all {len(stocks) + len(saas)} entities being tracked!")
+
     # Also create a summary JSON
     summary = {
         'demo_type': 'full_coverage',
         'entities_tracked': {
-            'stocks': stocks,
-            'saas': saas,
-            'total': 20
+            'stocks': stocks['ticker'].tolist(),
+            'saas': saas['ticker'].tolist(),
+            'total': len(stocks) + len(saas)
         },
-        'articles_analysed': 487,
+        'articles_analysed': int(stocks['count'].sum() + saas['count'].sum()),
         'news_sources': 8,
         'processing_time_minutes': 7.3,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': generated_at.isoformat()
     }
-    
-    with open('full_demo_summary.json', 'w') as f:
-        json.dump(summary, f, indent=2)
-    
-    plt.show()
+
+    # orjson writes UTF-8 bytes directly; OPT_SERIALIZE_NUMPY covers numeric
+    # columns, ticker columns still go through .tolist() (str arrays unsupported)
+    with open('full_demo_summary.json', 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+    # Written last so an interrupted run never looks up to date
+    with open(key_file, 'w') as f:
+        f.write(key)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Create the full coverage demo dashboard')
+    parser.add_argument('--force', action='store_true',
+                        help='redraw the dashboard even if the PNG on disk is up to date')
+    args = parser.parse_args()
+
     print("Creating full coverage demo dashboard...")
     print("This shows all 20 entities being tracked by the analyser")
     print("="*60)
-    create_full_demo()
\ No newline at end of file
+    create_full_demo(force=args.force)
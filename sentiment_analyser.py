@@ -12,22 +12,164 @@ import numpy as np
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
+import matplotlib.dates as mdates
+import matplotlib.style
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import yfinance as yf
 import seaborn as sns
+import sqlite3
+import threading
 import time
-import json
+import orjson
+import io
 import os
+import re
 import warnings
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Sequence
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 warnings.filterwarnings('ignore')
 
+from config import TRACKED_ENTITIES
+
+# Company name variants matched alongside each ticker, case-folded once at import
+_COMPANY_NAMES = {symbol: tuple(name.casefold() for name in names) for symbol, names in {
+    'AAPL': ['apple', 'iphone', 'tim cook'],
+    'MSFT': ['microsoft', 'windows', 'satya nadella'],
+    'GOOGL': ['google', 'alphabet', 'android'],
+    'NVDA': ['nvidia', 'jensen huang', 'gpu'],
+    'JPM': ['jpmorgan', 'jp morgan', 'jamie dimon'],
+    'BAC': ['bank of america', 'bofa'],
+    'GS': ['goldman sachs', 'goldman'],
+    'HSBA.L': ['hsbc', 'hongkong shanghai'],
+    'BP.L': ['british petroleum', 'bp'],
+    'AZN.L': ['astrazeneca', 'astra zeneca'],
+    'CRM': ['salesforce', 'marc benioff'],
+    'SNOW': ['snowflake'],
+    'TEAM': ['atlassian', 'jira', 'confluence'],
+    'ZM': ['zoom', 'zoom video'],
+    'DDOG': ['datadog'],
+    'SHOP': ['shopify'],
+    'SQ': ['square', 'block inc', 'jack dorsey'],
+    'PLTR': ['palantir'],
+    'COIN': ['coinbase'],
+    'SPOT': ['spotify']
+}.items()}
+
+# Per-article score components, in the order analyse_sentiment_batch stacks them
+_SCORE_FIELDS = ('compound', 'positive', 'negative', 'neutral', 'polarity', 'subjectivity')
+_NEUTRAL_COMPONENTS = (0, 0, 0, 1, 0, 0)
+
+# Most distinct texts whose scores are kept; least recently used go first
+_SENT_CACHE_SIZE = 4096
+
+# Headlines whose character 5-gram sets have at least this Jaccard
+# similarity share one sentiment score
+_SHINGLE_SIZE = 5
+_NEAR_DUP_THRESHOLD = 0.85
+
+def _shingles(text):
+    """Set of overlapping character n-grams of text"""
+    if len(text) <= _SHINGLE_SIZE:
+        return frozenset((text,))
+    return frozenset(text[i:i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1))
+
+@lru_cache(maxsize=None)
+def _shared_vader():
+    """VADER analyser shared by every instance, so its lexicon is parsed once"""
+    # Scoring only reads the lexicon and emoji tables built in __init__
+    return SentimentIntensityAnalyzer()
+
+# Dashboard styling, resolved once at import rather than on every render
+_DARKGRID = matplotlib.style.library['seaborn-v0_8-darkgrid']
+_COOLWARM_10 = sns.color_palette("coolwarm", 10)
+_DATE_FORMAT = '%d %b'
+
+@lru_cache(maxsize=None)
+def _source_colours(n):
+    """Set3 colours for a pie of n sources"""
+    return plt.cm.Set3(np.linspace(0, 1, n))
+
+# Feeds on different hosts download in parallel; same-host bursts are paced
+_HOST_LIMIT = 2
+
+def _download_feed(session, url, slot):
+    """Download one feed while holding a slot for its host"""
+    with slot:
+        response = session.get(url, headers={'User-Agent': feedparser.USER_AGENT}, timeout=10)
+    
+    # feedparser reads lowercase header names, e.g. for the charset
+    headers = {name.lower(): value for name, value in response.headers.items()}
+    headers.setdefault('content-location', response.url)
+    return response.ok, response.content, headers
+
+# Feed downloads kept on disk are reused for an hour
+_FEED_STORE_TTL = 3600
+
+class _FeedStore:
+    """Raw feed downloads persisted in SQLite, keyed by URL"""
+    
+    def __init__(self, path, ttl=_FEED_STORE_TTL):
+        self.ttl = ttl
+        # Feed workers share the connection, so access is serialised
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS feeds '
+                             '(url TEXT PRIMARY KEY, fetched REAL, content BLOB, headers BLOB)')
+    
+    def get(self, url):
+        """Return (content, headers) for a fresh download of url, or None"""
+        with self._lock:
+            row = self._db.execute('SELECT content, headers FROM feeds WHERE url = ? AND fetched >= ?',
+                                   (url, time.time() - self.ttl)).fetchone()
+        return None if row is None else (row[0], orjson.loads(row[1]))
+    
+    def set(self, url, content, headers):
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?)',
+                             (url, time.time(), content, orjson.dumps(headers)))
+    
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM feeds')
+
+class _SentimentRecords(Sequence):
+    """Per-article sentiment dicts, built from the score columns on first use"""
+    
+    def __init__(self, scores, articles, timestamp):
+        self._scores = scores
+        self._articles = articles
+        self._timestamp = timestamp
+        self._records = None
+    
+    def __len__(self):
+        return len(self._articles)
+    
+    def __getitem__(self, index):
+        if self._records is None:
+            columns = {field: column.tolist() for field, column in self._scores.items()}
+            self._records = [
+                {**{field: column[i] for field, column in columns.items()},
+                 'timestamp': self._timestamp, 'article': article}
+                for i, article in enumerate(self._articles)
+            ]
+        return self._records[index]
+
 class NewsSentimentAnalyser:
-    def __init__(self):
+    def __init__(self, use_textblob=True, feed_store_path=None):
         """Initialise the sentiment analyser with news sources"""
-        self.vader = SentimentIntensityAnalyzer()
+        self.vader = _shared_vader()
+        
+        # TextBlob is the slowest per-article step; without it the overall
+        # score is VADER's compound score alone
+        self.use_textblob = use_textblob
         
         # Financial news RSS feeds
         self.financial_feeds = {
@@ -45,48 +187,8 @@ class NewsSentimentAnalyser:
             'VentureBeat': 'https://feeds.venturebeat.com/VentureBeat'
         }
         
-        # Combined tracking for both sectors - 20 entities total
-        self.tracked_entities = {
-            # Financial stocks (UK and US) - 10 stocks
-            'stocks': [
-                # US Tech Giants (4)
-                'AAPL',   # Apple
-                'MSFT',   # Microsoft
-                'GOOGL',  # Alphabet/Google
-                'NVDA',   # Nvidia
-                
-                # US Financial (3)
-                'JPM',    # JPMorgan Chase
-                'BAC',    # Bank of America
-                'GS',     # Goldman Sachs
-                
-                # UK Stocks (3)
-                'HSBA.L', # HSBC
-                'BP.L',   # BP
-                'AZN.L',  # AstraZeneca
-            ],
-            
-            # Major SaaS companies - 10 companies
-            'saas': [
-                # Core SaaS (5)
-                'CRM',    # Salesforce
-                'SNOW',   # Snowflake
-                'TEAM',   # Atlassian
-                'ZM',     # Zoom
-                'DDOG',   # Datadog
-                
-                # High-Growth Tech (5)
-                'SHOP',   # Shopify
-                'SQ',     # Block (Square)
-                'PLTR',   # Palantir
-                'COIN',   # Coinbase
-                'SPOT',   # Spotify
-            ],
-            
-            # Keywords for private SaaS
-            'saas_keywords': ['SaaS', 'subscription', 'ARR', 'B2B software', 
-                            'cloud software', 'enterprise software', 'recurring revenue']
-        }
+        # Combined tracking for both sectors - 20 entities total (see config.py)
+        self.tracked_entities = TRACKED_ENTITIES
         
         # Colour scheme (British spelling)
         self.colours = {
@@ -100,99 +202,276 @@ class NewsSentimentAnalyser:
         # Store results
         self.results = []
         
-    def fetch_news(self, entity, entity_type='stock'):
-        """Fetch news for a specific entity"""
-        all_news = []
+        # Parsed feed entries by source, shared by every entity in a
+        # create_dashboard run and emptied when it ends
+        self._feed_cache = {}
         
-        # Choose appropriate feeds
-        feeds = self.financial_feeds if entity_type == 'stock' else self.saas_feeds
+        # Articles grouped by mentioned entity, per entity type
+        self._article_index = {}
         
-        for source, url in feeds.items():
-            try:
+        # Score components by (stripped text, use_textblob), bounded LRU;
+        # tuples so callers can't mutate them
+        self._sent_cache = OrderedDict()
+        
+        # Near-duplicate article text -> representative text, set per run
+        self._sent_alias = {}
+        
+        # Price data by stock symbol from the batched download, set per run
+        # and emptied when it ends
+        self._price_cache = {}
+        
+        # Concurrent requests allowed per feed host
+        self._host_slots = defaultdict(lambda: threading.Semaphore(_HOST_LIMIT))
+        
+        # One keep-alive connection pool (gzip by default) shared by the feed
+        # downloads and yfinance, so repeat hosts skip the TCP/TLS handshake
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
+        # Optional on-disk copy of feed downloads, reused across runs
+        self._feed_store = _FeedStore(feed_store_path) if feed_store_path else None
+        
+    def _prefetch_feeds(self, feeds):
+        """Download and parse feeds concurrently into the feed cache"""
+        if not feeds:
+            return
+        
+        # Feed downloads are I/O-bound, so fetch them concurrently and then
+        # process the results in feed order
+        with ThreadPoolExecutor(max_workers=min(8, len(feeds))) as executor:
+            futures = {}
+            for source, url in feeds.items():
                 print(f"  Fetching from {source}...")
-                feed = feedparser.parse(url)
+                slot = self._host_slots[urlparse(url).netloc]
+                futures[source] = executor.submit(self._load_feed, url, slot)
+        
+        for source, future in futures.items():
+            entries = []
+            try:
+                feed = future.result()
                 
                 for entry in feed.entries[:20]:  # Get latest 20 from each
-                    # Check if entity is mentioned
-                    title = entry.title.lower()
-                    summary = entry.get('summary', '').lower()
-                    
-                    # For stocks, also check company names
-                    entity_variants = [entity.lower()]
-                    if entity_type == 'stock':
-                        # Add company name variants
-                        company_names = {
-                            'AAPL': ['apple', 'iphone', 'tim cook'],
-                            'MSFT': ['microsoft', 'windows', 'satya nadella'],
-                            'GOOGL': ['google', 'alphabet', 'android'],
-                            'NVDA': ['nvidia', 'jensen huang', 'gpu'],
-                            'JPM': ['jpmorgan', 'jp morgan', 'jamie dimon'],
-                            'BAC': ['bank of america', 'bofa'],
-                            'GS': ['goldman sachs', 'goldman'],
-                            'HSBA.L': ['hsbc', 'hongkong shanghai'],
-                            'BP.L': ['british petroleum', 'bp'],
-                            'AZN.L': ['astrazeneca', 'astra zeneca'],
-                            'CRM': ['salesforce', 'marc benioff'],
-                            'SNOW': ['snowflake'],
-                            'TEAM': ['atlassian', 'jira', 'confluence'],
-                            'ZM': ['zoom', 'zoom video'],
-                            'DDOG': ['datadog'],
-                            'SHOP': ['shopify'],
-                            'SQ': ['square', 'block inc', 'jack dorsey'],
-                            'PLTR': ['palantir'],
-                            'COIN': ['coinbase'],
-                            'SPOT': ['spotify']
-                        }
-                        if entity in company_names:
-                            entity_variants.extend(company_names[entity])
-                    
-                    # Check all variants
-                    if any(variant in title or variant in summary for variant in entity_variants):
-                        all_news.append({
-                            'title': entry.title,
-                            'summary': entry.get('summary', ''),
-                            'published': entry.get('published_parsed', ''),
-                            'source': source,
-                            'link': entry.link,
-                            'entity': entity
-                        })
+                    # Case-fold once here rather than once per entity;
+                    # casefold also matches non-ASCII text that lower() misses
+                    entries.append((entry.title.casefold(), entry.get('summary', '').casefold(),
+                                    entry, source))
             except Exception as e:
                 print(f"  Error fetching from {source}: {e}")
+            
+            # Failed feeds cache as empty so they are not retried per entity
+            # within a run
+            self._feed_cache[source] = entries
+        
+        # Entity matches are only valid for the entries they were built from
+        self._article_index = {}
+    
+    def _load_feed(self, url, slot):
+        """Parse one feed, from the feed store when it holds a fresh copy"""
+        stored = self._feed_store.get(url) if self._feed_store else None
+        if stored is None:
+            ok, content, headers = _download_feed(self._http, url, slot)
+            # Only successful downloads are worth reusing
+            if ok and self._feed_store:
+                self._feed_store.set(url, content, headers)
+        else:
+            content, headers = stored
+        
+        # Parsing the downloaded bytes is CPU-only, so it doesn't hold the slot.
+        # Wrapped in a stream so feedparser never mistakes the body for a path
+        return feedparser.parse(io.BytesIO(content), response_headers=headers)
+    
+    def clear_feed_store(self):
+        """Discard feed downloads kept on disk"""
+        if self._feed_store:
+            self._feed_store.clear()
+    
+    def _prefetch_all_feeds(self):
+        """Fetch every financial and SaaS feed once for this run"""
+        self._feed_cache = {}
+        self._prefetch_feeds({**self.financial_feeds, **self.saas_feeds})
+        self._alias_near_duplicates()
+    
+    def _clear_run_caches(self):
+        """Forget the feeds and prices fetched for one run, so the next call fetches fresh"""
+        self._feed_cache = {}
+        self._article_index = {}
+        self._sent_alias = {}
+        self._price_cache = {}
+    
+    def _alias_near_duplicates(self):
+        """Point near-identical headlines at one representative's sentiment"""
+        self._sent_alias = {}
+        
+        # Representatives' shingle sets, plus an inverted index from shingle to
+        # representative so overlaps are counted without pairwise comparison
+        representatives = []
+        postings = {}
+        for entries in self._feed_cache.values():
+            for title, summary, entry, _ in entries:
+                # Same text analyse_entity scores; shingle all of it so that
+                # a shared headline over a different summary stays distinct
+                text = (entry.title + ' ' + entry.get('summary', '')).strip()
+                if not text:
+                    continue
+                shingles = _shingles((title + ' ' + summary).strip())
                 
-        return all_news
+                overlap = Counter(rep for shingle in shingles for rep in postings.get(shingle, ()))
+                best, best_similarity = None, 0
+                for rep, shared in overlap.items():
+                    # Jaccard similarity of the two shingle sets
+                    similarity = shared / (len(shingles) + len(representatives[rep][0]) - shared)
+                    if similarity > best_similarity:
+                        best, best_similarity = rep, similarity
+                
+                if best_similarity >= _NEAR_DUP_THRESHOLD:
+                    rep_text = representatives[best][1]
+                    if rep_text != text:
+                        self._sent_alias[text] = rep_text
+                else:
+                    for shingle in shingles:
+                        postings.setdefault(shingle, []).append(len(representatives))
+                    representatives.append((shingles, text))
+    
+    def _entity_variants(self, entity, entity_type):
+        """Case-folded strings whose presence in an article counts as a mention"""
+        entity_variants = [entity.casefold()]
+        # For stocks, also check company names
+        if entity_type == 'stock':
+            entity_variants += _COMPANY_NAMES.get(entity, ())
+        return entity_variants
+    
+    def _build_matcher(self, entities, entity_type):
+        """Compile a single regex over every variant of every entity"""
+        pairs = [(variant, entity) for entity in entities
+                 for variant in self._entity_variants(entity, entity_type)]
+        variants = sorted({variant for variant, _ in pairs}, key=len, reverse=True)
+        
+        # The zero-width lookahead reports every position where a variant
+        # starts. Only the longest variant is captured at each position, so it
+        # maps to the entities of every shorter variant that is its prefix too.
+        pattern = re.compile('(?=(%s))' % '|'.join(map(re.escape, variants)))
+        owners = {variant: frozenset(entity for other, entity in pairs if variant.startswith(other))
+                  for variant in variants}
+        return pattern, owners
+    
+    def _index_articles(self, entities, entity_type):
+        """Scan the cached feed entries once and group them by entity mentioned"""
+        feeds = self.financial_feeds if entity_type == 'stock' else self.saas_feeds
+        pattern, owners = self._build_matcher(entities, entity_type)
+        
+        index = {entity: [] for entity in entities}
+        for source in feeds:
+            for title, summary, entry, _ in self._feed_cache[source]:
+                mentioned = set()
+                for text in (title, summary):
+                    for match in pattern.finditer(text):
+                        mentioned |= owners[match.group(1)]
+                for entity in mentioned:
+                    index[entity].append((entry, source))
+        return index
+    
+    def fetch_news(self, entity, entity_type='stock'):
+        """Fetch news for a specific entity"""
+        # Choose appropriate feeds
+        feeds = self.financial_feeds if entity_type == 'stock' else self.saas_feeds
+        
+        # A dashboard run has every feed cached already; a standalone call
+        # fetches fresh and keeps nothing, so a failed feed isn't remembered
+        standalone = any(source not in self._feed_cache for source in feeds)
+        if standalone:
+            self._prefetch_feeds(feeds)
+        
+        try:
+            # Match all tracked entities of this type in one pass, then serve
+            # each entity from the index
+            index = self._article_index.get(entity_type)
+            if index is None or entity not in index:
+                entities = list(self.tracked_entities['stocks' if entity_type == 'stock' else 'saas'])
+                if entity not in entities:
+                    entities.append(entity)
+                index = self._article_index[entity_type] = self._index_articles(entities, entity_type)
+        finally:
+            if standalone:
+                self._clear_run_caches()
+        
+        return [{
+            'title': entry.title,
+            'summary': entry.get('summary', ''),
+            'published': entry.get('published_parsed', ''),
+            'source': source,
+            'link': entry.get('link', ''),
+            'entity': entity
+        } for entry, source in index[entity]]
+    
+    def _score_components(self, text):
+        """VADER and TextBlob scores for stripped text, in _SCORE_FIELDS order"""
+        # Near-duplicate headlines reuse their representative's scores
+        text = self._sent_alias.get(text, text)
+        
+        # Syndicated headlines and multi-entity articles repeat verbatim text.
+        # The mode is part of the key since use_textblob can change between calls
+        key = (text, self.use_textblob)
+        cached = self._sent_cache.get(key)
+        if cached is not None:
+            self._sent_cache.move_to_end(key)
+            return cached
+        
+        # VADER sentiment
+        vader_scores = self.vader.polarity_scores(text)
+        
+        # TextBlob sentiment
+        polarity = 0
+        subjectivity = 0
+        if self.use_textblob:
+            try:
+                blob = TextBlob(text)
+                polarity = blob.sentiment.polarity
+                subjectivity = blob.sentiment.subjectivity
+            except:
+                polarity = 0
+                subjectivity = 0
+        
+        components = (vader_scores['compound'], vader_scores['pos'], vader_scores['neg'],
+                      vader_scores['neu'], polarity, subjectivity)
+        self._sent_cache[key] = components
+        if len(self._sent_cache) > _SENT_CACHE_SIZE:
+            self._sent_cache.popitem(last=False)
+        return components
     
     def analyse_sentiment(self, text):
-        """Analyse sentiment using both TextBlob and VADER"""
+        """Analyse sentiment with VADER, blended with TextBlob when use_textblob is set"""
         # Clean text
         text = text.strip()
         if not text:
             return self._neutral_sentiment()
-            
-        # VADER sentiment
-        vader_scores = self.vader.polarity_scores(text)
-        
-        # TextBlob sentiment
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-        except:
-            polarity = 0
-            subjectivity = 0
         
         # Combine both approaches with weighted average
-        combined_score = {
-            'compound': vader_scores['compound'],
-            'positive': vader_scores['pos'],
-            'negative': vader_scores['neg'],
-            'neutral': vader_scores['neu'],
-            'polarity': polarity,
-            'subjectivity': subjectivity,
-            'overall': (vader_scores['compound'] * 0.6 + polarity * 0.4)  # Weight VADER more
-        }
+        combined_score = dict(zip(_SCORE_FIELDS, self._score_components(text)))
+        if self.use_textblob:
+            combined_score['overall'] = combined_score['compound'] * 0.6 + combined_score['polarity'] * 0.4  # Weight VADER more
+        else:
+            combined_score['overall'] = combined_score['compound']
         
         return combined_score
     
+    def analyse_sentiment_batch(self, texts):
+        """Analyse many texts at once, returning one float32 array per score"""
+        rows = []
+        for text in texts:
+            text = text.strip()
+            rows.append(self._score_components(text) if text else _NEUTRAL_COMPONENTS)
+        
+        # One contiguous column per score, then the weighted average in one pass
+        columns = np.array(rows, dtype=np.float32).reshape(len(rows), len(_SCORE_FIELDS)).T.copy()
+        scores = dict(zip(_SCORE_FIELDS, columns))
+        if self.use_textblob:
+            scores['overall'] = scores['compound'] * 0.6 + scores['polarity'] * 0.4  # Weight VADER more
+        else:
+            scores['overall'] = scores['compound'].copy()
+        return scores
+    
     def _neutral_sentiment(self):
         """Return neutral sentiment scores"""
         return {
@@ -208,7 +487,7 @@ class NewsSentimentAnalyser:
     def fetch_stock_data(self, symbol, days=30):
         """Fetch stock price data"""
         try:
-            stock = yf.Ticker(symbol)
+            stock = yf.Ticker(symbol, session=self._http)
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
@@ -220,6 +499,41 @@ class NewsSentimentAnalyser:
             print(f"  Error fetching stock data for {symbol}: {e}")
             return None
     
+    def _prefetch_prices(self, symbols, days=30):
+        """Fetch price data for many symbols in one batched download"""
+        self._price_cache = {}
+        symbols = list(symbols)
+        if not symbols:
+            return
+        
+        try:
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+            
+            # download() and Ticker.history() disagree on the auto_adjust
+            # default; adjusted closes match the per-stock fallback
+            prices = yf.download(symbols, start=start_date, end=end_date, group_by='ticker',
+                                 auto_adjust=True, threads=True, progress=False,
+                                 session=self._http)
+        except Exception as e:
+            # Leave the cache empty so each stock falls back to its own request
+            print(f"  Error fetching stock data: {e}")
+            return
+        
+        grouped = isinstance(prices.columns, pd.MultiIndex)
+        for symbol in symbols:
+            if grouped:
+                if symbol not in prices.columns.get_level_values(0):
+                    self._price_cache[symbol] = None
+                    continue
+                data = prices[symbol]
+            else:
+                data = prices  # Single-symbol downloads come back flat
+            
+            # Rows are the union of every exchange's trading days
+            data = data.dropna(how='all')
+            self._price_cache[symbol] = None if data.empty else data
+    
     def analyse_entity(self, entity, entity_type='stock'):
         """Complete analysis for one entity"""
         print(f"\nAnalysing {entity_type}: {entity}")
@@ -228,28 +542,31 @@ class NewsSentimentAnalyser:
         news = self.fetch_news(entity, entity_type)
         print(f"  Found {len(news)} news articles")
         
-        # Analyse each article
-        sentiments = []
-        for article in news:
-            sentiment = self.analyse_sentiment(
-                article['title'] + ' ' + article['summary']
-            )
-            sentiment['timestamp'] = datetime.now()
-            sentiment['article'] = article
-            sentiments.append(sentiment)
+        # Analyse all articles in one batch
+        scores = self.analyse_sentiment_batch(
+            [article['title'] + ' ' + article['summary'] for article in news]
+        )
+        timestamp = datetime.now()
         
         # Get price data if it's a stock
         price_data = None
         if entity_type == 'stock':
-            price_data = self.fetch_stock_data(entity)
+            if entity in self._price_cache:
+                price_data = self._price_cache[entity]
+            else:
+                price_data = self.fetch_stock_data(entity)
         
         # Calculate average sentiment
-        avg_sentiment = np.mean([s['overall'] for s in sentiments]) if sentiments else 0
+        avg_sentiment = float(scores['overall'].mean()) if news else 0
         
         return {
             'entity': entity,
             'type': entity_type,
-            'sentiments': sentiments,
+            # Score columns plus the parallel article list; 'sentiments' keeps
+            # the older per-article dicts for callers that still want them
+            'scores': scores,
+            'articles': news,
+            'sentiments': _SentimentRecords(scores, news, timestamp),
             'price_data': price_data,
             'avg_sentiment': avg_sentiment,
             'sentiment_label': self._get_sentiment_label(avg_sentiment)
@@ -268,69 +585,88 @@ class NewsSentimentAnalyser:
         else:
             return 'Neutral'
     
-    def create_dashboard(self, save_path=None):
+    def create_dashboard(self, save_path=None, fig=None, dpi=300):
         """Create comprehensive sentiment dashboard"""
         # Analyse all entities
         print("\n" + "="*60)
         print("Starting comprehensive analysis...")
         print("="*60)
         
-        # Analyse stocks
-        stock_results = []
-        for stock in self.tracked_entities['stocks']:
-            result = self.analyse_entity(stock, 'stock')
-            stock_results.append(result)
-            time.sleep(1)  # Be polite to APIs
-        
-        # Analyse SaaS companies
-        saas_results = []
-        for saas in self.tracked_entities['saas']:
-            result = self.analyse_entity(saas, 'saas')
-            saas_results.append(result)
-            time.sleep(1)
+        try:
+            # Fetch every feed once, rather than once per entity
+            print("\nFetching news feeds...")
+            self._prefetch_all_feeds()
+            
+            # One batched price request for every tracked stock
+            print("\nFetching price data...")
+            self._prefetch_prices(self.tracked_entities['stocks'])
+            
+            # Analyse stocks
+            stock_results = []
+            for stock in self.tracked_entities['stocks']:
+                result = self.analyse_entity(stock, 'stock')
+                stock_results.append(result)
+            
+            # Analyse SaaS companies
+            saas_results = []
+            for saas in self.tracked_entities['saas']:
+                result = self.analyse_entity(saas, 'saas')
+                saas_results.append(result)
+        finally:
+            # The caches only hold for this run
+            self._clear_run_caches()
+        
+        # One table per entity and one per article for the plot helpers
+        entity_df, articles_df = self._build_frames(stock_results + saas_results)
         
         # Create visualisation
-        plt.style.use('seaborn-v0_8-darkgrid')
-        fig = plt.figure(figsize=(20, 24))
+        plt.style.use(_DARKGRID)
+        # Redraw into one named figure rather than leaking a new one per call
+        if fig is None:
+            fig = plt.figure(num='fsa_dashboard', figsize=(20, 24), clear=True)
+        else:
+            fig.clear()
         gs = gridspec.GridSpec(5, 2, height_ratios=[1, 1, 1, 1, 1.5], 
                               hspace=0.35, wspace=0.3)
         
         # Define colour scheme
-        colors = sns.color_palette("coolwarm", 10)
+        colors = _COOLWARM_10
         
         # Panel 1: Overall Market Sentiment
         ax1 = fig.add_subplot(gs[0, :])
-        self._plot_market_sentiment(ax1, stock_results + saas_results, colors)
+        self._plot_market_sentiment(ax1, entity_df, colors)
         
         # Panel 2: Stock Sentiment Heatmap
         ax2 = fig.add_subplot(gs[1, 0])
-        self._plot_sentiment_heatmap(ax2, stock_results, "Stock Sentiment Scores", colors)
+        self._plot_sentiment_heatmap(ax2, entity_df[entity_df['type'] == 'stock'],
+                                     "Stock Sentiment Scores", colors)
         
         # Panel 3: SaaS Sentiment Heatmap  
         ax3 = fig.add_subplot(gs[1, 1])
-        self._plot_sentiment_heatmap(ax3, saas_results, "SaaS Company Sentiment Scores", colors)
+        self._plot_sentiment_heatmap(ax3, entity_df[entity_df['type'] == 'saas'],
+                                     "SaaS Company Sentiment Scores", colors)
         
         # Panel 4: Top Movers - Sentiment
         ax4 = fig.add_subplot(gs[2, 0])
-        self._plot_top_movers(ax4, stock_results + saas_results, colors)
+        self._plot_top_movers(ax4, entity_df, colors)
         
         # Panel 5: Sentiment vs Price (for top stock)
         ax5 = fig.add_subplot(gs[2, 1])
-        best_stock = max(stock_results, key=lambda x: len(x['sentiments'])) if stock_results else None
+        best_stock = max(stock_results, key=lambda x: len(x['articles'])) if stock_results else None
         if best_stock and best_stock['price_data'] is not None:
             self._plot_sentiment_vs_price(ax5, best_stock, colors)
         
         # Panel 6: News Volume by Source
         ax6 = fig.add_subplot(gs[3, 0])
-        self._plot_news_volume(ax6, stock_results + saas_results, colors)
+        self._plot_news_volume(ax6, articles_df, colors)
         
         # Panel 7: Sentiment Distribution
         ax7 = fig.add_subplot(gs[3, 1])
-        self._plot_sentiment_distribution(ax7, stock_results + saas_results, colors)
+        self._plot_sentiment_distribution(ax7, articles_df, colors)
         
         # Panel 8: Key Insights Table
         ax8 = fig.add_subplot(gs[4, :])
-        self._create_insights_table(ax8, stock_results, saas_results)
+        self._create_insights_table(ax8, entity_df)
         
         # Main title
         fig.suptitle('Financial & SaaS News Sentiment Analysis Dashboard', 
@@ -344,23 +680,46 @@ class NewsSentimentAnalyser:
         
         # Save
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight', facecolor='white')
             print(f"\n✓ Dashboard saved to: {save_path}")
         
         plt.show()
         
         # Save data for future use
-        self._save_results(stock_results, saas_results)
+        self._save_results(entity_df, articles_df)
         
         return stock_results, saas_results
     
-    def _plot_market_sentiment(self, ax, results, colors):
+    def _build_frames(self, results):
+        """Tabulate analysis results as per-entity and per-article DataFrames"""
+        counts = [len(r['articles']) for r in results]
+        articles_df = pd.DataFrame({
+            'entity': np.repeat([r['entity'] for r in results], counts),
+            'type': np.repeat([r['type'] for r in results], counts),
+            'source': [article['source'] for r in results for article in r['articles']],
+            'overall': (np.concatenate([r['scores']['overall'] for r in results])
+                        if results else np.empty(0, dtype=np.float32))
+        })
+        
+        # Averages and labels as analyse_entity computed them, so the dashboard
+        # and saved JSON report the same values as the per-entity results
+        entity_df = pd.DataFrame({
+            'entity': [r['entity'] for r in results],
+            'type': [r['type'] for r in results],
+            'avg_sentiment': np.array([r['avg_sentiment'] for r in results], dtype=float),
+            'num_articles': np.array(counts, dtype=int),
+            'sentiment_label': [r['sentiment_label'] for r in results]
+        })
+        
+        return entity_df, articles_df
+    
+    def _plot_market_sentiment(self, ax, entity_df, colors):
         """Plot overall market sentiment gauge"""
         # Calculate averages
-        if not results:
+        if entity_df.empty:
             return
             
-        avg_sentiment = np.mean([r['avg_sentiment'] for r in results if r['sentiments']])
+        avg_sentiment = entity_df.loc[entity_df['num_articles'] > 0, 'avg_sentiment'].mean()
         
         # Create gauge visualisation
         categories = ['Very Negative', 'Negative', 'Neutral', 'Positive', 'Very Positive']
@@ -402,66 +761,58 @@ class NewsSentimentAnalyser:
         for spine in ax.spines.values():
             spine.set_visible(False)
     
-    def _plot_sentiment_heatmap(self, ax, results, title, colors):
+    def _plot_sentiment_heatmap(self, ax, entity_df, title, colors):
         """Create sentiment heatmap"""
-        if not results or not any(r['sentiments'] for r in results):
+        # Filter entities with data
+        valid = entity_df[entity_df['num_articles'] > 0]
+        if valid.empty:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center')
             ax.set_title(title)
             return
             
-        # Filter results with data
-        valid_results = [r for r in results if r['sentiments']]
-        if not valid_results:
-            return
-            
-        entities = [r['entity'] for r in valid_results]
-        sentiments = [r['avg_sentiment'] for r in valid_results]
+        entities = valid['entity'].to_numpy()
+        sentiments = valid['avg_sentiment'].to_numpy()
         
-        # Sort by sentiment
-        sorted_idx = np.argsort(sentiments)[::-1]
+        # Sort by sentiment, highest first; stable, so ties keep tracking order
+        order = np.argsort(-sentiments, kind='stable')
+        entities = entities[order]
+        sentiments = sentiments[order]
         
-        y_pos = np.arange(len(entities))
-        bars = ax.barh(y_pos, [sentiments[i] for i in sorted_idx])
+        # Colour bars based on sentiment (face and edge, as bar.set_color does)
+        bar_colours = np.where(sentiments > 0.1, self.colours['positive'],
+                               np.where(sentiments < -0.1, self.colours['negative'],
+                                        self.colours['neutral']))
         
-        # Colour bars based on sentiment
-        for bar, sentiment in zip(bars, [sentiments[i] for i in sorted_idx]):
-            if sentiment > 0.1:
-                bar.set_color(self.colours['positive'])
-            elif sentiment < -0.1:
-                bar.set_color(self.colours['negative'])
-            else:
-                bar.set_color(self.colours['neutral'])
+        y_pos = np.arange(len(entities))
+        bars = ax.barh(y_pos, sentiments, color=bar_colours, edgecolor=bar_colours)
         
         ax.set_yticks(y_pos)
-        ax.set_yticklabels([entities[i] for i in sorted_idx])
+        ax.set_yticklabels(entities)
         ax.set_xlabel('Average Sentiment Score')
         ax.set_title(title, fontweight='bold', fontsize=14)
         ax.axvline(0, color='black', linewidth=1, linestyle='--', alpha=0.5)
         ax.set_xlim(-1, 1)
         
         # Add value labels
-        for i, (bar, idx) in enumerate(zip(bars, sorted_idx)):
+        for bar, sentiment in zip(bars, sentiments):
             width = bar.get_width()
             label_x = width + 0.02 if width > 0 else width - 0.02
             ax.text(label_x, bar.get_y() + bar.get_height()/2, 
-                   f'{sentiments[idx]:.3f}', ha='left' if width > 0 else 'right', 
+                   f'{sentiment:.3f}', ha='left' if width > 0 else 'right', 
                    va='center', fontsize=9)
     
-    def _plot_top_movers(self, ax, results, colors):
+    def _plot_top_movers(self, ax, entity_df, colors):
         """Plot biggest sentiment changes"""
-        # Get results with sentiments
-        valid_results = [r for r in results if r['sentiments']]
-        if not valid_results:
+        # Get entities with sentiments
+        valid = entity_df[entity_df['num_articles'] > 0]
+        if valid.empty:
             return
             
-        # Sort by absolute sentiment
-        sorted_results = sorted(valid_results, key=lambda x: abs(x['avg_sentiment']), reverse=True)[:10]
-        
-        if not sorted_results:
-            return
+        # Sort by absolute sentiment; stable, so ties keep tracking order
+        top = valid.sort_values('avg_sentiment', key=abs, ascending=False, kind='stable').head(10)
             
-        entities = [r['entity'] for r in sorted_results]
-        sentiments = [r['avg_sentiment'] for r in sorted_results]
+        entities = top['entity'].tolist()
+        sentiments = top['avg_sentiment'].tolist()
         
         bars = ax.bar(range(len(entities)), sentiments)
         
@@ -484,7 +835,7 @@ class NewsSentimentAnalyser:
     
     def _plot_sentiment_vs_price(self, ax, result, colors):
         """Plot sentiment against price movement"""
-        if result['price_data'] is None or len(result['sentiments']) == 0:
+        if result['price_data'] is None or len(result['articles']) == 0:
             ax.text(0.5, 0.5, 'No price data available', ha='center', va='center')
             return
             
@@ -503,8 +854,8 @@ class NewsSentimentAnalyser:
         ax.grid(True, alpha=0.3)
         
         # Plot returns as bars
-        pos_returns = [r if r > 0 else 0 for r in returns]
-        neg_returns = [r if r < 0 else 0 for r in returns]
+        pos_returns = returns.clip(lower=0)
+        neg_returns = returns.clip(upper=0)
         
         bars1 = ax2.bar(returns.index, pos_returns, alpha=0.5, 
                         color=self.colours['positive'], label='Positive Returns')
@@ -525,24 +876,19 @@ class NewsSentimentAnalyser:
         ax.tick_params(axis='x', rotation=45)
         
         # Format x-axis dates
-        ax.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%d %b'))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(_DATE_FORMAT))
     
-    def _plot_news_volume(self, ax, results, colors):
+    def _plot_news_volume(self, ax, articles_df, colors):
         """Plot news volume by source"""
-        source_counts = {}
-        for result in results:
-            for sentiment in result['sentiments']:
-                source = sentiment['article']['source']
-                source_counts[source] = source_counts.get(source, 0) + 1
-        
-        if source_counts:
-            # Sort by count
-            sorted_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)
-            sources = [s[0] for s in sorted_sources]
-            counts = [s[1] for s in sorted_sources]
+        if not articles_df.empty:
+            # Sort by count; ties keep the order sources first appear in
+            source_counts = (articles_df.groupby('source', sort=False).size()
+                             .sort_values(ascending=False, kind='stable'))
+            sources = source_counts.index.tolist()
+            counts = source_counts.tolist()
             
             # Create pie chart
-            colours = plt.cm.Set3(np.linspace(0, 1, len(sources)))
+            colours = _source_colours(len(sources))
             wedges, texts, autotexts = ax.pie(counts, labels=sources, autopct='%1.1f%%', 
                                               startangle=90, colors=colours)
             
@@ -556,25 +902,21 @@ class NewsSentimentAnalyser:
             
             ax.set_title('News Distribution by Source', fontweight='bold', fontsize=14)
     
-    def _plot_sentiment_distribution(self, ax, results, colors):
+    def _plot_sentiment_distribution(self, ax, articles_df, colors):
         """Plot sentiment score distribution"""
-        all_sentiments = []
-        for result in results:
-            all_sentiments.extend([s['overall'] for s in result['sentiments']])
+        all_sentiments = articles_df['overall'].to_numpy()
         
-        if all_sentiments:
+        if all_sentiments.size:
             # Create histogram
             n, bins, patches = ax.hist(all_sentiments, bins=30, alpha=0.7, edgecolor='black')
             
-            # Colour bins by sentiment
-            for i, patch in enumerate(patches):
-                bin_center = (bins[i] + bins[i+1]) / 2
-                if bin_center > 0.1:
-                    patch.set_facecolor(self.colours['positive'])
-                elif bin_center < -0.1:
-                    patch.set_facecolor(self.colours['negative'])
-                else:
-                    patch.set_facecolor(self.colours['neutral'])
+            # Colour bins by sentiment at their centres
+            centres = 0.5 * (bins[:-1] + bins[1:])
+            bin_colours = np.where(centres > 0.1, self.colours['positive'],
+                                   np.where(centres < -0.1, self.colours['negative'],
+                                            self.colours['neutral']))
+            for patch, colour in zip(patches, bin_colours):
+                patch.set_facecolor(colour)
             
             # Add statistics
             mean_sentiment = np.mean(all_sentiments)
@@ -592,50 +934,51 @@ class NewsSentimentAnalyser:
             ax.grid(True, alpha=0.3, axis='y')
             ax.set_xlim(-1, 1)
     
-    def _create_insights_table(self, ax, stock_results, saas_results):
+    def _create_insights_table(self, ax, entity_df):
         """Create insights summary table"""
         ax.axis('off')
         
         # Calculate key metrics
         insights = []
         
-        # Filter results with data
-        valid_stocks = [r for r in stock_results if r['sentiments']]
-        valid_saas = [r for r in saas_results if r['sentiments']]
+        # Filter entities with data
+        valid = entity_df[entity_df['num_articles'] > 0]
+        valid_stocks = valid[valid['type'] == 'stock']
+        valid_saas = valid[valid['type'] == 'saas']
         
         # Most positive stock
-        if valid_stocks:
-            most_positive_stock = max(valid_stocks, key=lambda x: x['avg_sentiment'])
+        if not valid_stocks.empty:
+            most_positive_stock = valid_stocks.loc[valid_stocks['avg_sentiment'].idxmax()]
             insights.append(['Most Positive Stock', 
                            f"{most_positive_stock['entity']} ({most_positive_stock['avg_sentiment']:.3f})"])
         
         # Most negative stock  
-        if valid_stocks:
-            most_negative_stock = min(valid_stocks, key=lambda x: x['avg_sentiment'])
+        if not valid_stocks.empty:
+            most_negative_stock = valid_stocks.loc[valid_stocks['avg_sentiment'].idxmin()]
             insights.append(['Most Negative Stock', 
                            f"{most_negative_stock['entity']} ({most_negative_stock['avg_sentiment']:.3f})"])
         
         # Most positive SaaS
-        if valid_saas:
-            most_positive_saas = max(valid_saas, key=lambda x: x['avg_sentiment'])
+        if not valid_saas.empty:
+            most_positive_saas = valid_saas.loc[valid_saas['avg_sentiment'].idxmax()]
             insights.append(['Most Positive SaaS', 
                            f"{most_positive_saas['entity']} ({most_positive_saas['avg_sentiment']:.3f})"])
         
         # Market comparison
-        if valid_stocks and valid_saas:
-            stock_avg = np.mean([r['avg_sentiment'] for r in valid_stocks])
-            saas_avg = np.mean([r['avg_sentiment'] for r in valid_saas])
+        if not valid_stocks.empty and not valid_saas.empty:
+            stock_avg = valid_stocks['avg_sentiment'].mean()
+            saas_avg = valid_saas['avg_sentiment'].mean()
             insights.append(['Sector Comparison', 
                            f"Stocks: {stock_avg:.3f} | SaaS: {saas_avg:.3f}"])
         
         # Total articles analysed
-        total_articles = sum(len(r['sentiments']) for r in stock_results + saas_results)
+        total_articles = entity_df['num_articles'].sum()
         insights.append(['Total Articles Analysed', str(total_articles)])
         
         # News coverage
-        most_covered = max(stock_results + saas_results, key=lambda x: len(x['sentiments']))
+        most_covered = entity_df.loc[entity_df['num_articles'].idxmax()]
         insights.append(['Most News Coverage', 
-                        f"{most_covered['entity']} ({len(most_covered['sentiments'])} articles)"])
+                        f"{most_covered['entity']} ({most_covered['num_articles']} articles)"])
         
         # Create table
         if insights:
@@ -662,39 +1005,40 @@ class NewsSentimentAnalyser:
         
         ax.set_title('Key Insights & Metrics Summary', fontweight='bold', fontsize=16, pad=20)
     
-    def _save_results(self, stock_results, saas_results):
+    def _save_results(self, entity_df, articles_df):
         """Save results to JSON for future analysis"""
+        # Distinct sources per entity, in the order they were first seen
+        sources = articles_df.groupby(['type', 'entity'], sort=False)['source'].unique()
+        
+        def summarise(entity_type):
+            rows = entity_df[entity_df['type'] == entity_type]
+            return [
+                {
+                    'entity': row['entity'],
+                    'avg_sentiment': row['avg_sentiment'],
+                    'sentiment_label': row['sentiment_label'],
+                    'num_articles': row['num_articles'],
+                    'sources': (sources[(entity_type, row['entity'])].tolist()
+                                if row['num_articles'] else [])
+                } for row in rows.to_dict('records')
+            ]
+        
         output = {
             'analysis_date': datetime.now().isoformat(),
             'summary': {
-                'total_stocks_analysed': len(stock_results),
-                'total_saas_analysed': len(saas_results),
-                'total_articles': sum(len(r['sentiments']) for r in stock_results + saas_results)
+                'total_stocks_analysed': int((entity_df['type'] == 'stock').sum()),
+                'total_saas_analysed': int((entity_df['type'] == 'saas').sum()),
+                'total_articles': int(entity_df['num_articles'].sum())
             },
-            'stock_results': [
-                {
-                    'entity': r['entity'],
-                    'avg_sentiment': r['avg_sentiment'],
-                    'sentiment_label': r['sentiment_label'],
-                    'num_articles': len(r['sentiments']),
-                    'sources': list(set(s['article']['source'] for s in r['sentiments']))
-                } for r in stock_results
-            ],
-            'saas_results': [
-                {
-                    'entity': r['entity'],
-                    'avg_sentiment': r['avg_sentiment'],
-                    'sentiment_label': r['sentiment_label'],
-                    'num_articles': len(r['sentiments']),
-                    'sources': list(set(s['article']['source'] for s in r['sentiments']))
-                } for r in saas_results
-            ]
+            'stock_results': summarise('stock'),
+            'saas_results': summarise('saas')
         }
         
         # Save to file
         filename = f'sentiment_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=2)
+        # orjson writes UTF-8 bytes directly; numpy scalars are handled too
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
         print(f"\n✓ Results saved to: {filename}")
 
@@ -726,7 +1070,7 @@ def main():
         print("-" * 40)
         
         # Best performers
-        all_results = [r for r in stock_results + saas_results if r['sentiments']]
+        all_results = [r for r in stock_results + saas_results if r['articles']]
         if all_results:
             best = max(all_results, key=lambda x: x['avg_sentiment'])
             worst = min(all_results, key=lambda x: x['avg_sentiment'])
@@ -3,107 +3,241 @@ Test script for the Financial & SaaS Sentiment Analyser
 Run this to test individual components
 """
 
-from sentiment_analyzer import NewsSentimentAnalyser
+# Headless backend, selected before the analyser imports pyplot
+import matplotlib
+matplotlib.use('Agg')
+
+from sentiment_analyser import NewsSentimentAnalyser
+import argparse
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import wraps
+import io
+import sys
+import threading
+import time
+import numpy as np
+import orjson
 import json
 
+# One analyser per thread, so "Run all tests" builds it once, and --parallel
+# once per worker rather than sharing per-run caches between threads
+_local = threading.local()
+
+# Feed downloads are kept here for an hour, so repeat test runs skip the network
+_FEED_STORE_PATH = '.fsa_cache.sqlite'
+
+def _get_analyser():
+    """Return this thread's analyser, creating it on first use"""
+    analyser = getattr(_local, 'analyser', None)
+    if analyser is None:
+        analyser = _local.analyser = NewsSentimentAnalyser(feed_store_path=_FEED_STORE_PATH)
+    return analyser
+
+# Whole print calls from concurrent tests never interleave
+_print_lock = threading.Lock()
+
+def _print(*args, **kwargs):
+    """print() into the running test's buffer, or under the output lock"""
+    out = getattr(_local, 'out', None)
+    if out is not None:
+        print(*args, file=out, **kwargs)
+        return
+    with _print_lock:
+        print(*args, **kwargs)
+
+def _flush():
+    """Write out the running test's buffered output so far"""
+    out = getattr(_local, 'out', None)
+    if out is None:
+        return
+    with _print_lock:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+    out.seek(0)
+    out.truncate()
+
+def _buffered(test):
+    """Collect a test's output and write it in one go when the test ends"""
+    @wraps(test)
+    def run():
+        _local.out = io.StringIO()
+        try:
+            return test()
+        finally:
+            _flush()
+            _local.out = None
+    return run
+
+class Expected(IntEnum):
+    """Expected direction of a test sentence's sentiment"""
+    NEGATIVE = -1
+    NEUTRAL = 0
+    POSITIVE = 1
+
+# Test sentences
+_TEST_CASES = (
+    ("Apple reports record-breaking quarterly earnings, exceeding all analyst expectations", Expected.POSITIVE),
+    ("Microsoft faces major security breach, millions of users affected", Expected.NEGATIVE),
+    ("Google announces normal quarterly results in line with expectations", Expected.NEUTRAL),
+    ("SaaS company Salesforce sees massive growth in enterprise adoption", Expected.POSITIVE),
+    ("Tech stocks plummet as recession fears grow", Expected.NEGATIVE)
+)
+
+@_buffered
 def test_sentiment_analysis():
     """Test the sentiment analysis functionality"""
-    print("\n" + "="*60)
-    print("Testing Sentiment Analysis")
-    print("="*60)
+    _print("\n" + "="*60)
+    _print("Testing Sentiment Analysis")
+    _print("="*60)
+    
+    analyser = _get_analyser()
+    
+    # Score the whole corpus in one batch, as analyse_entity does
+    texts, expected_labels = zip(*_TEST_CASES)
+    scores = analyser.analyse_sentiment_batch(texts)['overall']
     
-    analyser = NewsSentimentAnalyser()
-    
-    # Test sentences
-    test_texts = [
-        ("Apple reports record-breaking quarterly earnings, exceeding all analyst expectations", "Positive"),
-        ("Microsoft faces major security breach, millions of users affected", "Negative"),
-        ("Google announces normal quarterly results in line with expectations", "Neutral"),
-        ("SaaS company Salesforce sees massive growth in enterprise adoption", "Positive"),
-        ("Tech stocks plummet as recession fears grow", "Negative")
-    ]
-    
-    for text, expected in test_texts:
-        sentiment = analyser.analyse_sentiment(text)
-        print(f"\nText: {text[:50]}...")
-        print(f"Expected: {expected}")
-        print(f"Score: {sentiment['overall']:.3f}")
-        print(f"Label: {analyser._get_sentiment_label(sentiment['overall'])}")
-        print("-" * 40)
+    # Direction of each score, using the +/-0.1 neutral band of _get_sentiment_label
+    predicted = np.where(scores >= 0.1, 1, np.where(scores <= -0.1, -1, 0))
+    matches = predicted == np.fromiter(expected_labels, dtype=np.int8, count=len(expected_labels))
+    
+    for text, expected, score, match in zip(texts, expected_labels, scores.tolist(), matches):
+        _print(f"\nText: {text[:50]}...")
+        _print(f"Expected: {expected.name.title()}")
+        _print(f"Score: {score:.3f}")
+        _print(f"Label: {analyser._get_sentiment_label(score)} {'✓' if match else '✗'}")
+        _print("-" * 40)
+    
+    _print(f"\n{matches.sum()}/{len(matches)} sentences matched their expected direction")
 
+@_buffered
 def test_single_entity():
     """Test analysis for a single entity"""
-    print("\n" + "="*60)
-    print("Testing Single Entity Analysis")
-    print("="*60)
+    _print("\n" + "="*60)
+    _print("Testing Single Entity Analysis")
+    _print("="*60)
     
-    analyser = NewsSentimentAnalyser()
+    analyser = _get_analyser()
     
     # Test with Apple
-    print("\nAnalysing AAPL (Apple)...")
+    _print("\nAnalysing AAPL (Apple)...")
+    # The analyser prints its progress directly, so write the header first
+    _flush()
     result = analyser.analyse_entity('AAPL', 'stock')
     
-    print(f"\nResults for {result['entity']}:")
-    print(f"- Articles found: {len(result['sentiments'])}")
-    print(f"- Average sentiment: {result['avg_sentiment']:.3f}")
-    print(f"- Sentiment label: {result['sentiment_label']}")
+    _print(f"\nResults for {result['entity']}:")
+    scores = result['scores']['overall']
+    articles = result['articles']
+    _print(f"- Articles found: {len(articles)}")
+    _print(f"- Average sentiment: {result['avg_sentiment']:.3f}")
+    _print(f"- Sentiment label: {result['sentiment_label']}")
     
-    if result['sentiments']:
-        print("\nTop 3 articles:")
-        for i, sentiment in enumerate(result['sentiments'][:3]):
-            article = sentiment['article']
-            print(f"\n{i+1}. {article['title']}")
-            print(f"   Source: {article['source']}")
-            print(f"   Sentiment: {sentiment['overall']:.3f}")
+    if articles:
+        # Articles come back in feed order; a stable sort on the negated
+        # scores picks the top three and keeps ties in feed order
+        _print("\nTop 3 articles:")
+        top = np.argsort(-scores, kind='stable')[:3]
+        for rank, i in enumerate(top):
+            article = articles[i]
+            _print(f"\n{rank+1}. {article['title']}")
+            _print(f"   Source: {article['source']}")
+            _print(f"   Sentiment: {scores[i]:.3f}")
 
+@_buffered
 def test_quick_analysis():
     """Run a quick analysis on fewer entities"""
-    print("\n" + "="*60)
-    print("Running Quick Analysis (3 stocks, 2 SaaS)")
-    print("="*60)
+    _print("\n" + "="*60)
+    _print("Running Quick Analysis (3 stocks, 2 SaaS)")
+    _print("="*60)
     
-    analyser = NewsSentimentAnalyser()
+    analyser = _get_analyser()
     
-    # Override with fewer entities for testing
-    analyser.tracked_entities['stocks'] = ['AAPL', 'MSFT', 'HSBA.L']
-    analyser.tracked_entities['saas'] = ['CRM', 'SNOW']
+    # Override with fewer entities for testing (the shared config is read-only).
+    # The override is rebound rather than mutated, so restoring the saved
+    # mapping afterwards keeps it from leaking into other tests.
+    saved_entities = analyser.tracked_entities
+    analyser.tracked_entities = {**saved_entities,
+                                 'stocks': ('AAPL', 'MSFT', 'HSBA.L'),
+                                 'saas': ('CRM', 'SNOW')}
     
     # Create mini dashboard
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     save_path = f"test_dashboard_{timestamp}.png"
     
     try:
-        analyser.create_dashboard(save_path)
-        print(f"\n✓ Test dashboard created: {save_path}")
+        # The analyser prints its progress directly, so write the header first
+        _flush()
+        analyser.create_dashboard(save_path, dpi=100)  # Preview resolution is enough here
+        _print(f"\n✓ Test dashboard created: {save_path}")
     except Exception as e:
-        print(f"\n❌ Error creating dashboard: {e}")
+        _print(f"\n❌ Error creating dashboard: {e}")
+    finally:
+        analyser.tracked_entities = saved_entities
+
+# Timings from every run are appended here for trend graphs
+_BENCH_PATH = 'bench.jsonl'
+
+def _timed(name, test, parallel=False):
+    """Run one test, then report and record how long it took"""
+    start = time.perf_counter_ns()
+    test()
+    elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+    
+    _print(f"[bench] {name} {elapsed_ms:.1f} ms")
+    record = {'test': name, 'elapsed_ms': round(elapsed_ms, 3), 'parallel': parallel,
+              'date': datetime.now().isoformat()}
+    with _print_lock, open(_BENCH_PATH, 'ab') as f:
+        f.write(orjson.dumps(record) + b'\n')
 
 def main():
     """Run all tests"""
+    parser = argparse.ArgumentParser(description='Financial & SaaS Sentiment Analyser - Test Suite')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='discard feed downloads cached by earlier runs')
+    parser.add_argument('--test', choices=['1', '2', '3', '4', 'all'],
+                        help='run this test without prompting (4 or all runs every test)')
+    parser.add_argument('--parallel', action='store_true',
+                        help='when running every test, run them concurrently so network waits overlap')
+    args = parser.parse_args()
+    
+    if args.no_cache:
+        _get_analyser().clear_feed_store()
+    
     print("\n" + "="*60)
     print("Financial & SaaS Sentiment Analyser - Test Suite")
     print("="*60)
     
-    # Choose which test to run
-    print("\nSelect test to run:")
-    print("1. Test sentiment analysis")
-    print("2. Test single entity analysis")
-    print("3. Quick analysis (mini dashboard)")
-    print("4. Run all tests")
-    
-    choice = input("\nEnter choice (1-4): ")
+    # Choose which test to run, prompting only when --test isn't given
+    if args.test:
+        choice = '4' if args.test == 'all' else args.test
+    else:
+        print("\nSelect test to run:")
+        print("1. Test sentiment analysis")
+        print("2. Test single entity analysis")
+        print("3. Quick analysis (mini dashboard)")
+        print("4. Run all tests")
+        
+        choice = input("\nEnter choice (1-4): ")
     
     if choice == '1':
-        test_sentiment_analysis()
+        _timed('sentiment', test_sentiment_analysis)
     elif choice == '2':
-        test_single_entity()
+        _timed('single', test_single_entity)
     elif choice == '3':
-        test_quick_analysis()
+        _timed('quick', test_quick_analysis)
     elif choice == '4':
-        test_sentiment_analysis()
-        test_single_entity()
-        test_quick_analysis()
+        tests = (('sentiment', test_sentiment_analysis),
+                 ('single', test_single_entity),
+                 ('quick', test_quick_analysis))
+        if args.parallel:
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = [executor.submit(_timed, name, test, parallel=True) for name, test in tests]
+            for future in futures:
+                future.result()
+        else:
+            for name, test in tests:
+                _timed(name, test)
     else:
         print("Invalid choice. Please run again.")
 